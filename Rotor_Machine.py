@@ -9,11 +9,158 @@
 #   EnigmaMachine - class for a full Enigma type machine with a steckerboard and reflector
 #   SteppingGenerator - class for a generic stepping control component for a rotor machine
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
+
+from rotor import rotor
+
+# Numba is optional; without it the block-encryption kernels below still run as plain Python,
+# they just lose the compiled speedup
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Compiled C inner loop, also optional; built with: python setup.py build_ext --inplace
+try:
+    import _rotor_c
+except ImportError:
+    _rotor_c = None
+
+
+# Compiled inner loop for SIGABA block encryption/decryption
+# Takes the rotor wirings stacked into 2D int8 arrays and the rotor positions as 1D arrays,
+# with the rotor forward/backward math inlined so there are no method calls per character.
+# Positions arrays are updated in place so the caller can write them back to the rotor objects.
+def _sigaba_crypt_block(cipher_wiring, cipher_reverse_wiring, control_wiring,
+        cipher_positions, control_positions, index_map, control_inputs,
+        step_order, step_position, decrypt, xs, out):
+    num_cipher = cipher_wiring.shape[0]
+    num_control = control_wiring.shape[0]
+    n = cipher_wiring.shape[1]
+    m = control_wiring.shape[1]
+    stepping = np.zeros(num_cipher, dtype=np.bool_)
+    # Operands stay within (-n, n) or [0, 2n-2), so every modulo below is replaced with a
+    # branchless conditional add/subtract instead of an integer division
+    for k in range(xs.shape[0]):
+        x = int(xs[k])
+        if decrypt:
+            for i in range(num_cipher - 1, -1, -1):
+                p = cipher_positions[i]
+                t = x - p
+                t += (t < 0) * n
+                x = cipher_reverse_wiring[i, t] + p
+                x -= (x >= n) * n
+        else:
+            for i in range(num_cipher):
+                p = cipher_positions[i]
+                t = x - p
+                t += (t < 0) * n
+                x = cipher_wiring[i, t] + p
+                x -= (x >= n) * n
+        out[k] = x
+        # Control rotor outputs select which cipher rotors step
+        for i in range(num_cipher): stepping[i] = False
+        for c in control_inputs:
+            z = int(c)
+            for i in range(num_control):
+                p = control_positions[i]
+                t = z - p
+                t += (t < 0) * m
+                z = control_wiring[i, t] + p
+                z -= (z >= m) * m
+            z = index_map[z]
+            if z != -1: stepping[z] = True
+        for i in range(num_cipher):
+            if stepping[i]:
+                p = cipher_positions[i] + 1
+                cipher_positions[i] = p - (p >= n) * n
+        # Odometer stepping of the control rotors
+        j = step_order[0]
+        p = control_positions[j] + 1
+        control_positions[j] = p - (p >= m) * m
+        for i in range(1, step_order.shape[0]):
+            t = control_positions[step_order[i - 1]] - 1
+            t += (t < 0) * m
+            if t == step_position:
+                j = step_order[i]
+                p = control_positions[j] + 1
+                control_positions[j] = p - (p >= m) * m
+            else: break
+
+
+# Parallel variant for batches of independent messages, e.g. brute-force key search
+# xs/out are (M, L) arrays and the position arrays are (M, num_rotors), one row per message
+def _sigaba_crypt_batch(cipher_wiring, cipher_reverse_wiring, control_wiring,
+        cipher_positions, control_positions, index_map, control_inputs,
+        step_order, step_position, decrypt, xs, out):
+    for k in prange(xs.shape[0]):
+        _sigaba_crypt_block(cipher_wiring, cipher_reverse_wiring, control_wiring,
+            cipher_positions[k], control_positions[k], index_map, control_inputs,
+            step_order, step_position, decrypt, xs[k], out[k])
+
+
+# Compiled inner loop for Enigma block encryption/decryption
+# Same layout as the SIGABA kernel; the steckerboard and reflector are passed as single
+# wiring rows with their own positions, and has_reflector selects the reflected path
+def _enigma_crypt_block(wiring, reverse_wiring, positions, stepping_positions,
+        stecker_wiring, stecker_reverse_wiring, stecker_position,
+        reflector_wiring, reflector_position, has_reflector, decrypt, xs, out):
+    num_rotors = wiring.shape[0]
+    n = wiring.shape[1]
+    # Same branchless conditional add/subtract in place of modulo as the SIGABA kernel
+    for k in range(xs.shape[0]):
+        x = int(xs[k])
+        if has_reflector or not decrypt:
+            t = x - stecker_position
+            t += (t < 0) * n
+            x = stecker_wiring[t] + stecker_position
+            x -= (x >= n) * n
+            for i in range(num_rotors):
+                p = positions[i]
+                t = x - p
+                t += (t < 0) * n
+                x = wiring[i, t] + p
+                x -= (x >= n) * n
+        if has_reflector:
+            t = x - reflector_position
+            t += (t < 0) * n
+            x = reflector_wiring[t] + reflector_position
+            x -= (x >= n) * n
+        if has_reflector or decrypt:
+            for i in range(num_rotors - 1, -1, -1):
+                p = positions[i]
+                t = x - p
+                t += (t < 0) * n
+                x = reverse_wiring[i, t] + p
+                x -= (x >= n) * n
+            t = x - stecker_position
+            t += (t < 0) * n
+            x = stecker_reverse_wiring[t] + stecker_position
+            x -= (x >= n) * n
+        out[k] = x
+        # Enigma convention: rotors step backward after each character
+        p = positions[0] - 1
+        positions[0] = p + (p < 0) * n
+        for i in range(1, num_rotors):
+            t = positions[i - 1] + 1
+            t -= (t >= n) * n
+            if t == stepping_positions[i - 1]:
+                p = positions[i] - 1
+                positions[i] = p + (p < 0) * n
+            else: break
+
+
+if njit is not None:
+    _sigaba_crypt_block = njit(cache=True)(_sigaba_crypt_block)
+    _sigaba_crypt_batch = njit(cache=True, parallel=True)(_sigaba_crypt_batch)
+    _enigma_crypt_block = njit(cache=True)(_enigma_crypt_block)
 # Base class representing a single fully-assembled virtual rotor machine.
 # This class defines the basic functions and structure of a virtual rotor machine
-
-from types import List
-import rotor
 class RotorMachine:
 
     def set_cipher_rotors(self, rotors: List[rotor]):
@@ -38,6 +185,14 @@ class SIGABAMachine:
         self.cipher_rotor_size = rotors[0].get_size()
         if __debug__:
             for r in rotors: assert r.get_size() == self.cipher_rotor_size
+        # Structure-of-arrays copies of the bank: wirings and per-position tables stacked into
+        # contiguous matrices, and the positions in one array, so the hot paths touch flat int8
+        # storage instead of chasing a Python object per rotor
+        self.cipher_wiring = np.stack([r.get_wiring() for r in rotors])
+        self.cipher_reverse_wiring = np.stack([r.get_reverse_wiring() for r in rotors])
+        self.cipher_enc_tables = np.stack([r.enc_tables for r in rotors])
+        self.cipher_dec_tables = np.stack([r.dec_tables for r in rotors])
+        self.cipher_positions = np.array([r.get_position() for r in rotors], dtype=np.uint8)
 
     def set_control_rotors(self, rotors: List[rotor]):
         self.control_rotors = rotors
@@ -45,16 +200,22 @@ class SIGABAMachine:
         self.control_rotor_size = rotors[0].get_size()
         if __debug__:
             for r in rotors: assert r.get_size() == self.control_rotor_size
+        self.control_wiring = np.stack([r.get_wiring() for r in rotors])
+        self.control_enc_tables = np.stack([r.enc_tables for r in rotors])
+        self.control_dec_tables = np.stack([r.dec_tables for r in rotors])
+        self.control_positions = np.array([r.get_position() for r in rotors], dtype=np.uint8)
 
+    # Entries are cipher rotor numbers, or -1 for control outputs that step nothing; stored as
+    # int8 since every value fits in a byte
     def set_index_map(self, index_map: List[int]):
         assert len(index_map) == self.control_rotor_size
-        self.index_map = index_map
-    
+        self.index_map = np.asarray(index_map, dtype=np.int8)
+
     # Sets the inputs to the control rotor bank
     def set_control_inputs(self, control_inputs: List[int]):
         if __debug__:
-            for i in control_inputs: assert input[i] not in control_inputs[0,i]
-        self.control_inputs = control_inputs
+            for i in range(0, len(control_inputs)): assert control_inputs[i] not in control_inputs[0:i]
+        self.control_inputs = np.asarray(control_inputs, dtype=np.uint8)
     
     # Step next-slower control rotor when a faster control rotor steps PAST this position
     def set_control_step_position(self, position: int):
@@ -65,11 +226,13 @@ class SIGABAMachine:
     # Each subsequent rotor steps once per full rotation of the preceding rotor
     # The list does not need to include every rotor; any rotors not listed will not step at all
     def set_control_step_order(self, order: List[int]):
-        self.control_step_order = order
+        self.control_step_order = np.asarray(order, dtype=np.uint8)
 
     def reset_rotors(self):
         for r in self.cipher_rotors: r.set_position(0)
         for r in self.control_rotors: r.set_position(0)
+        self.cipher_positions[:] = 0
+        self.control_positions[:] = 0
 
     def set_rotor_positions(self, cipher_positions: List[int], control_positions: List[int]):
         self.set_cipher_rotor_positions(cipher_positions)
@@ -77,57 +240,70 @@ class SIGABAMachine:
 
     def set_cipher_rotor_positions(self, cipher_positions: List[int]):
         assert len(cipher_positions) == self.num_cipher_rotors
-        for i in range(0, self.num_cipher_rotors): cipher_rotors[i].set_position(cipher_positions[i])
+        for i in range(0, self.num_cipher_rotors): self.set_cipher_rotor_position(i, cipher_positions[i])
 #        for r in self.cipher_rotors, i in cipher_positions:
 #            r.set_position(i)
-    
+
     def set_control_rotor_positions(self, control_positions: List[int]):
         assert  len(control_positions) == self.num_control_rotors
-        for i in range(0, self.num_control_rotors): control_rotors[i].set_position(control_positions[i])
-    
+        for i in range(0, self.num_control_rotors): self.set_control_rotor_position(i, control_positions[i])
+
     def set_cipher_rotor_position(self, rotor: int, position: int):
         self.cipher_rotors[rotor].set_position(position)
-    
+        self.cipher_positions[rotor] = self.cipher_rotors[rotor].position
+
     def set_control_rotor_position(self, rotor: int, position: int):
         self.control_rotors[rotor].set_position(position)
+        self.control_positions[rotor] = self.control_rotors[rotor].position
 
     # Pass an input through the cipher rotors.  Does not step the rotors by itself.
     def encipher(self, x: int) -> int:
-        for r in cipher_rotors: x = r.encrypt(x)
-        return x
-    
+        for i in range(0, self.num_cipher_rotors):
+            x = self.cipher_enc_tables[i, self.cipher_positions[i], x]
+        return int(x)
+
     # Pass an input backwards through the cipher rotors.  Does not step the rotors by itself.
     def decipher(self, y: int) -> int:
-        for i in range(0, self.num_cipher_rotors):
-            y = self.cipher_rotors[self.num_rotors - 1 - i].decrypt(y)
-        return y
-    
+        for i in range(self.num_cipher_rotors - 1, -1, -1):
+            y = self.cipher_dec_tables[i, self.cipher_positions[i], y]
+        return int(y)
+
     # Pass an input through the control rotors
     def control(self, x: int) -> int:
-        for r in self.control_rotors: x = r.encrypt(x)
-        return x
-    
+        for i in range(0, self.num_control_rotors):
+            x = self.control_enc_tables[i, self.control_positions[i], x]
+        return int(x)
+
     # Pass an input through the control rotors backwards
     def control_back(self, x: int) -> int:
-        for i in range(0, self.num_control_rotors):
-            x = self.control_rotors[self.num_control_rotors -1 - i].decrypt(x)
-        return x
+        for i in range(self.num_control_rotors - 1, -1, -1):
+            x = self.control_dec_tables[i, self.control_positions[i], x]
+        return int(x)
     
     # Calculates control rotor outputs and steps the cipher rotors
+    # Works on the positions array in place; the stepped entries are mirrored back to the
+    # rotor objects so the per-rotor API stays consistent
     def step_cipher_rotors(self):
-        stepping = [False for i in range(0, self.num_control_rotors)]
+        stepping = np.zeros(self.num_cipher_rotors, dtype=bool)
         for c in self.control_inputs:
             z = self.index_map[self.control(c)]
             if z != -1: stepping[z] = True
-        for i in range(0, len(stepping)):
-            if stepping[i]: self.cipher_rotors[i].step()
+        self.cipher_positions[stepping] = (self.cipher_positions[stepping] + 1) % self.cipher_rotor_size
+        for i in np.nonzero(stepping)[0]:
+            self.cipher_rotors[i].set_position(int(self.cipher_positions[i]))
 
     # Steps the control rotors, using odometer type stepping
     def step_control_rotors(self):
-        self.control_rotors[self.control_rotor_stepping[0]].step()
-        for i in range(1, len(self.control_stepping_order)):
-            if (self.control_rotors[i-1].get_position() - 1) % self.control_alphabet_size == self.control_step_position:
-                self.control_rotors[i].step()
+        positions = self.control_positions
+        m = self.control_rotor_size
+        j = self.control_step_order[0]
+        positions[j] = (int(positions[j]) + 1) % m
+        self.control_rotors[j].set_position(int(positions[j]))
+        for i in range(1, len(self.control_step_order)):
+            if (int(positions[self.control_step_order[i-1]]) - 1) % m == self.control_step_position:
+                j = self.control_step_order[i]
+                positions[j] = (int(positions[j]) + 1) % m
+                self.control_rotors[j].set_position(int(positions[j]))
             else: break
 
     # Encrypt a single input value and step the rotors
@@ -144,6 +320,111 @@ class SIGABAMachine:
         self.step_control_rotors()
         return x
 
+    # Cumulative control rotor step counts before each of `length` characters, computed for the
+    # whole message in one vectorized pass.  Odometer stepping is fully determined by the
+    # starting positions, so each rotor's trigger events along the stepping chain are derived as
+    # a boolean vector and accumulated with cumsum instead of looping per character.
+    def control_step_counts(self, length: int) -> np.ndarray:
+        m = self.control_rotor_size
+        counts = np.zeros((self.num_control_rotors, length), dtype=np.int64)
+        if length == 0: return counts
+        event = np.ones(length, dtype=bool)
+        prev_counts = np.arange(length)
+        counts[self.control_step_order[0]] = prev_counts
+        for k in range(1, len(self.control_step_order)):
+            prev = self.control_step_order[k - 1]
+            event = event & ((int(self.control_positions[prev]) + prev_counts) % m == self.control_step_position)
+            prev_counts = np.concatenate(([0], np.cumsum(event)[:-1]))
+            counts[self.control_step_order[k]] = prev_counts
+        return counts
+
+    # Cumulative cipher rotor step counts before each of `length` characters
+    # Every control input is pushed through the control bank for all time steps at once via the
+    # stacked tables, mapped through the index map, and reduced to a per-rotor stepping mask
+    # that cumsum turns into the schedule
+    def cipher_step_counts(self, length: int) -> np.ndarray:
+        m = self.control_rotor_size
+        pos_c = (self.control_positions.astype(np.int64)[:, None] + self.control_step_counts(length)) % m
+        mask = np.zeros((self.num_cipher_rotors, length), dtype=bool)
+        for c in self.control_inputs:
+            x = np.full(length, int(c), dtype=np.intp)
+            for i in range(0, self.num_control_rotors):
+                x = np.take(self.control_enc_tables[i], pos_c[i] * m + x)
+            z = self.index_map[x]
+            valid = np.nonzero(z != -1)[0]
+            mask[z[valid], valid] = True
+        counts = np.zeros((self.num_cipher_rotors, length), dtype=np.int64)
+        counts[:, 1:] = np.cumsum(mask, axis=1)[:, :-1]
+        return counts
+
+    # Encrypt a whole message in vectorized NumPy: both stepping schedules are precomputed for
+    # the full message, then each cipher rotor layer is one fancy-indexed gather.  Equivalent to
+    # calling encrypt per character, and leaves the rotors where the message ends.
+    def encrypt_bulk(self, xs: np.ndarray) -> np.ndarray:
+        return self._crypt_bulk(xs, False)
+
+    # Bulk counterpart of decrypt; the schedules are data-independent, so they are identical
+    def decrypt_bulk(self, ys: np.ndarray) -> np.ndarray:
+        return self._crypt_bulk(ys, True)
+
+    def _crypt_bulk(self, xs: np.ndarray, decrypt: bool) -> np.ndarray:
+        xs = np.asarray(xs, dtype=np.intp)
+        length = xs.shape[0]
+        n = self.cipher_rotor_size
+        # Schedules one character past the end give the final rotor state as well
+        ccounts = self.control_step_counts(length + 1)
+        scounts = self.cipher_step_counts(length + 1)
+        pos = (self.cipher_positions.astype(np.int64)[:, None] + scounts[:, :length]) % n
+        if decrypt:
+            for i in range(self.num_cipher_rotors - 1, -1, -1):
+                xs = np.take(self.cipher_dec_tables[i], pos[i] * n + xs)
+        else:
+            for i in range(0, self.num_cipher_rotors):
+                xs = np.take(self.cipher_enc_tables[i], pos[i] * n + xs)
+        for i in range(0, self.num_cipher_rotors):
+            self.set_cipher_rotor_position(i, int(self.cipher_positions[i]) + int(scounts[i, length]))
+        for i in range(0, self.num_control_rotors):
+            self.set_control_rotor_position(i, int(self.control_positions[i]) + int(ccounts[i, length]))
+        return xs.astype(np.uint8)
+
+    # Encrypt a whole message through the compiled kernel, stepping the rotors as usual
+    # Equivalent to calling encrypt once per character, but without per-character Python dispatch
+    def encrypt_block(self, xs: np.ndarray) -> np.ndarray:
+        return self._crypt_block(xs, False)
+
+    # Block counterpart of decrypt
+    def decrypt_block(self, ys: np.ndarray) -> np.ndarray:
+        return self._crypt_block(ys, True)
+
+    def _crypt_block(self, xs: np.ndarray, decrypt: bool) -> np.ndarray:
+        xs = np.ascontiguousarray(xs, dtype=np.uint8)
+        out = np.empty_like(xs)
+        cipher_positions = np.array([r.get_position() for r in self.cipher_rotors], dtype=np.int64)
+        control_positions = np.array([r.get_position() for r in self.control_rotors], dtype=np.int64)
+        _sigaba_crypt_block(self.cipher_wiring, self.cipher_reverse_wiring, self.control_wiring,
+            cipher_positions, control_positions, self.index_map, self.control_inputs,
+            self.control_step_order, self.control_step_position, decrypt, xs, out)
+        for i in range(0, self.num_cipher_rotors): self.set_cipher_rotor_position(i, int(cipher_positions[i]))
+        for i in range(0, self.num_control_rotors): self.set_control_rotor_position(i, int(control_positions[i]))
+        return out
+
+    # Encrypt or decrypt many independent messages in parallel, one rotor state per message
+    # xs is an (M, L) array and cipher_positions/control_positions are (M, num_rotors) arrays of
+    # starting positions, one row per message.  Intended for brute-force key search, so the
+    # machine's own rotor positions are left untouched.
+    def crypt_batch(self, xs: np.ndarray, cipher_positions: np.ndarray, control_positions: np.ndarray,
+            decrypt: bool = False) -> np.ndarray:
+        xs = np.ascontiguousarray(xs, dtype=np.uint8)
+        out = np.empty_like(xs)
+        # The kernel advances the position rows in place, so always hand it copies:
+        # ascontiguousarray would alias a caller's int64 array and corrupt their candidate grid
+        _sigaba_crypt_batch(self.cipher_wiring, self.cipher_reverse_wiring, self.control_wiring,
+            np.array(cipher_positions, dtype=np.int64),
+            np.array(control_positions, dtype=np.int64),
+            self.index_map, self.control_inputs, self.control_step_order,
+            self.control_step_position, decrypt, xs, out)
+        return out
+
 
 # Class for an Enigma type machine with a reflector and a steckerboard
 class EnigmaMachine:
@@ -159,36 +440,83 @@ class EnigmaMachine:
         self.rotors = rotors
         self.num_rotors = len(rotors)
         self.rotor_size = rotors[0].get_size()
-    
+        # Stacked copies of the wirings for the compiled block kernel
+        self.wiring = np.stack([r.get_wiring() for r in rotors])
+        self.reverse_wiring = np.stack([r.get_reverse_wiring() for r in rotors])
+        self.positions = np.array([r.get_position() for r in rotors], dtype=np.uint8)
+        # SWAR constants and packed positions: one byte per rotor in a single integer, so the
+        # odometer carry can be resolved with word-wide arithmetic instead of a per-rotor loop
+        self._swar_ones = sum(1 << (8 * i) for i in range(0, self.num_rotors))
+        self._swar_highs = self._swar_ones * 0x80
+        self._swar_full = (1 << (8 * self.num_rotors)) - 1
+        self._pos_packed = sum(int(p) << (8 * i) for i, p in enumerate(self.positions))
+
+    # Rotor positions should be set through the machine so the positions array and the rotor
+    # objects stay consistent, as with the SIGABA machine
+    def set_rotor_positions(self, positions: List[int]):
+        assert len(positions) == self.num_rotors
+        for i in range(0, self.num_rotors): self.set_rotor_position(i, positions[i])
+
+    def set_rotor_position(self, rotor: int, position: int):
+        self.rotors[rotor].set_position(position)
+        self.positions[rotor] = self.rotors[rotor].position
+        self._pos_packed = (self._pos_packed & ~(0xFF << (8 * rotor))) | (int(self.positions[rotor]) << (8 * rotor))
+
     def set_reflector(self, reflector: rotor):
         self.reflector = reflector
-    
+
     def set_steckerboard(self, steckerboard: rotor):
         if steckerboard == None:
-            self.steckerboard = rotor(range(self.rotor_size))
+            self.steckerboard = rotor(list(range(self.rotor_size)))
         else:
             self.steckerboard = steckerboard
-    
+
     def set_stepping_positions(self, stepping_positions: List[int]):
         if stepping_positions == None: stepping_positions = [1 for i in range(0, self.num_rotors)]
-        self.stepping_positions = stepping_positions
-    
+        self.stepping_positions = np.asarray(stepping_positions, dtype=np.uint8)
+        self._step_packed = sum(int(p) << (8 * i) for i, p in enumerate(self.stepping_positions))
+
+    # Branchless SWAR odometer over the packed positions word (one byte per rotor)
+    # A rotor carries into the next one exactly when its old position equals the stepping
+    # position, so all carry triggers are byte-equality tests computed at once; the data
+    # dependent break of the per-rotor loop becomes a lowest-set-bit extraction.  Only the bytes
+    # that actually stepped are mirrored back to the positions array and the rotor objects.
     def step_rotors(self):
-        self.rotors[0].step(-1)
-        for i in range(1, self.rotor_size):
-            if (self.rotors[i-1].get_position() + 1) % self.rotor_size == self.stepping_positions[i-1]:
-                self.rotors[i].step(-1)
-            else:
-                break
+        packed = self._pos_packed
+        ones = self._swar_ones
+        highs = self._swar_highs
+        full = self._swar_full
+        low7 = ones * 0x7F
+        # 0x80 per byte where the rotor sits on its stepping position: rotor i's new position p
+        # satisfies (p + 1) % n == stepping_positions[i] exactly when its old byte equals it
+        # (exact per-byte zero test - adding 0x7F cannot carry across bytes)
+        x = packed ^ self._step_packed
+        eq = (((((x & low7) + low7) | x) & highs)) ^ highs
+        # first non-trigger byte stops the carry; everything below and including it steps
+        stop = (eq ^ highs) | (0x80 << (8 * self.num_rotors))
+        mask = ((stop & -stop) << 1) - 1
+        m01 = mask & ones
+        mh = mask & highs
+        # decrement the stepping bytes without borrowing across bytes, then wrap 0 -> n - 1
+        zero = ((((((packed & low7) + low7) | packed) & highs)) ^ highs) & mh
+        packed = ((packed | mh) - m01) & (mh ^ full)
+        packed -= (zero >> 7) * (0x7F - (self.rotor_size - 1))
+        self._pos_packed = packed
+        i = 0
+        while (m01 >> (8 * i)) & 1:
+            p = (packed >> (8 * i)) & 0xFF
+            self.positions[i] = p
+            self.rotors[i].set_position(p)
+            i += 1
 
     def encrypt(self, x: int) -> int:
-        y = self.steckerboard.encrypt(x)
-        for r in self.rotors: y = r.encrypt(y)
+        y = self.steckerboard.encode(x)
+        for r in self.rotors: y = r.encode(y)
         if self.reflector != None:
-            y = self.reflector.encrypt(y)
+            y = self.reflector.encode(y)
             for i in range(self.num_rotors -1, -1, -1):
-                y = self.rotors[i].decrypt(y)
-            y = self.steckerboard.decrypt(y)
+                y = self.rotors[i].decode(y)
+            y = self.steckerboard.decode(y)
         self.step_rotors()
         return y
 
@@ -197,11 +525,37 @@ class EnigmaMachine:
             return self.encrypt(y)
         else:
             for i in range(self.num_rotors -1, -1, -1):
-                y = self.rotors[i].decrypt(y)
-            x = steckerboard.decrypt(y)
+                y = self.rotors[i].decode(y)
+            x = self.steckerboard.decode(y)
             self.step_rotors()
             return x
 
+    # Encrypt a whole message through the compiled kernel, stepping the rotors as usual
+    def encrypt_block(self, xs: np.ndarray) -> np.ndarray:
+        return self._crypt_block(xs, False)
+
+    # Block counterpart of decrypt; with a reflector fitted this is the same as encrypt_block
+    def decrypt_block(self, ys: np.ndarray) -> np.ndarray:
+        return self._crypt_block(ys, True)
+
+    def _crypt_block(self, xs: np.ndarray, decrypt: bool) -> np.ndarray:
+        xs = np.ascontiguousarray(xs, dtype=np.uint8)
+        out = np.empty_like(xs)
+        positions = self.positions.astype(np.int64)
+        if self.reflector != None:
+            reflector_wiring = self.reflector.get_wiring()
+            reflector_position = self.reflector.get_position()
+        else:
+            reflector_wiring = np.zeros(self.rotor_size, dtype=np.int8)
+            reflector_position = 0
+        _enigma_crypt_block(self.wiring, self.reverse_wiring, positions,
+            self.stepping_positions,
+            self.steckerboard.get_wiring(), self.steckerboard.get_reverse_wiring(),
+            self.steckerboard.get_position(),
+            reflector_wiring, reflector_position, self.reflector != None, decrypt, xs, out)
+        for i in range(0, self.num_rotors): self.set_rotor_position(i, int(positions[i]))
+        return out
+
 
 
 
@@ -220,7 +574,54 @@ class RotorBank:
         self.rotor_size = self.rotors[0].get_size()
         if __debug__:
             for r in self.rotors: assert r.get_size() == self.rotor_size
-    
+        self._composite_cache = (None, None)
+        self._slow_composite_cache = (None, None)
+        # Per-position tables stacked into (num_rotors, size, size) arrays for the C inner loop
+        self.enc_table_stack = np.ascontiguousarray(np.stack([r.enc_tables for r in rotors]))
+        self.dec_table_stack = np.ascontiguousarray(np.stack([r.dec_tables for r in rotors]))
+        self._build_codecs()
+
+    # Emit scalar encrypt/decrypt functions specialized to this bank's rotor count
+    # The per-rotor loop is unrolled at set_rotors time with each rotor bound as a default
+    # argument, so the per-character path carries no loop setup, no rotors-list indexing and no
+    # bound-method allocation; positions are read live from the rotor objects
+    def _build_codecs(self):
+        binds = ", ".join(f"_r{i}=_rotors[{i}]" for i in range(0, self.num_rotors))
+        body_enc = "\n".join(f"    x = _r{i}.enc_tables[_r{i}.position][x]" for i in range(0, self.num_rotors))
+        body_dec = "\n".join(f"    y = _r{i}.dec_tables[_r{i}.position][y]" for i in range(self.num_rotors - 1, -1, -1))
+        ns = {"_rotors": self.rotors}
+        exec(f"def _enc(x, {binds}):\n{body_enc}\n    return int(x)", ns)
+        exec(f"def _dec(y, {binds}):\n{body_dec}\n    return int(y)", ns)
+        self._enc_fn = ns["_enc"]
+        self._dec_fn = ns["_dec"]
+
+    # Collapse the whole bank at its current positions into one composite substitution table
+    # At any fixed tuple of positions the bank is a single permutation of [0, size), so characters
+    # that share a rotor state need one gather instead of one per rotor.  The table is cached and
+    # rebuilt only when a rotor position has changed; a rebuild is O(num_rotors * size).
+    def composite_table(self) -> np.ndarray:
+        key = tuple(r.position for r in self.rotors)
+        if self._composite_cache[0] != key:
+            t = np.arange(self.rotor_size, dtype=np.int8)
+            for r in self.rotors: t = r.enc_tables[r.position][t]
+            self._composite_cache = (key, t)
+        return self._composite_cache[1]
+
+    # Composite table for the decryption direction (reverse rotor order, reverse wirings)
+    def composite_decrypt_table(self) -> np.ndarray:
+        return np.argsort(self.composite_table()).astype(np.int8)
+
+    # Composite of every rotor except the fastest (rotor 0)
+    # In an odometer machine only rotor 0 moves every character, so this part of the bank is
+    # reusable across a whole run of characters; cached the same way as composite_table
+    def slow_composite_table(self) -> np.ndarray:
+        key = tuple(r.position for r in self.rotors[1:])
+        if self._slow_composite_cache[0] != key:
+            t = np.arange(self.rotor_size, dtype=np.int8)
+            for r in self.rotors[1:]: t = r.enc_tables[r.position][t]
+            self._slow_composite_cache = (key, t)
+        return self._slow_composite_cache[1]
+
     def reset_positions(self):
         self.set_positions([0 for i in range(0, self.num_rotors)])
 
@@ -243,25 +644,177 @@ class RotorBank:
     def step_rotor(self, rotor: int, steps: int = 1):
         self.rotors[rotor].step(steps)
 
-    def encrypt(self, x: int) -> int:
-        for r in self.rotors: x = r.encrypt(x)
-        return x
-    
-    def decrypt(self, y: int) -> int:
+    def encrypt(self, x: int) -> int: return self._enc_fn(x)
+
+    def decrypt(self, y: int) -> int: return self._dec_fn(y)
+
+    # Encrypts an entire message at once using NumPy gathers instead of the per-character loop
+    # step_counts, if given, is an array of shape (num_rotors, L) holding the cumulative number of
+    # steps each rotor has taken before each of the L characters; the stepping schedule itself
+    # depends on the machine driving the bank, so it is computed separately and passed in.
+    # If step_counts is omitted, the rotors are treated as stationary at their current positions.
+    def encrypt_bulk(self, xs: np.ndarray, step_counts: np.ndarray = None) -> np.ndarray:
+        if step_counts is None:
+            return self._apply_table(self.composite_table(), xs)
+        xs = np.asarray(xs, dtype=np.int32)
+        n = self.rotor_size
+        for i in range(0, self.num_rotors):
+            r = self.rotors[i]
+            if step_counts is None: pos = r.position
+            else: pos = (r.position + step_counts[i]) % n
+            # np.take is noticeably faster than fancy indexing on these small tables
+            xs = (np.take(r.wiring, (xs - pos) % n) + pos) % n
+        return xs
+
+    # Bulk counterpart of decrypt; walks the rotors in reverse order through the reverse wiring
+    def decrypt_bulk(self, ys: np.ndarray, step_counts: np.ndarray = None) -> np.ndarray:
+        if step_counts is None:
+            return self._apply_table(self.composite_decrypt_table(), ys)
+        ys = np.asarray(ys, dtype=np.int32)
+        n = self.rotor_size
         for i in range(self.num_rotors - 1, -1, -1):
-            y = self.rotors[i].decrypt(y)
-        return y
+            r = self.rotors[i]
+            if step_counts is None: pos = r.position
+            else: pos = (r.position + step_counts[i]) % n
+            ys = (np.take(r.reverse_wiring, (ys - pos) % n) + pos) % n
+        return ys
 
-    def encrypt_with_intermediates(self, x: int) -> List[int]:
-        y = list(range(self.num_rotors + 1))
-        y[0] = x
+    # Cache-blocked bulk encryption: processes the message in epochs during which only the
+    # fastest rotor (rotor 0) moves, composing the stationary slower rotors into one LUT per
+    # epoch.  Same signature and output as encrypt_bulk with step_counts, but amortized to about
+    # one fast-table lookup plus one LUT gather per character; with odometer stepping the slow
+    # composite is rebuilt only once per rollover of rotor 0.
+    def encrypt_bulk_blocked(self, xs: np.ndarray, step_counts: np.ndarray) -> np.ndarray:
+        xs = np.asarray(xs, dtype=np.intp)
+        n = self.rotor_size
+        positions = self._schedule_positions(step_counts, xs.shape[0])
+        out = np.empty(xs.shape[0], dtype=np.uint8)
+        fast_tables = self.rotors[0].enc_tables
+        for s, e in self._epochs(positions):
+            t = np.arange(n, dtype=np.int8)
+            for i in range(1, self.num_rotors):
+                t = self.rotors[i].enc_tables[positions[i, s]][t]
+            mid = np.take(fast_tables, positions[0, s:e] * n + xs[s:e]).astype(np.uint8)
+            out[s:e] = self._apply_table(t, mid)
+        return out
+
+    # Blocked counterpart of decrypt_bulk: the slow composite is inverted first, then the
+    # fastest rotor's reverse table
+    def decrypt_bulk_blocked(self, ys: np.ndarray, step_counts: np.ndarray) -> np.ndarray:
+        ys = np.asarray(ys, dtype=np.intp)
+        n = self.rotor_size
+        positions = self._schedule_positions(step_counts, ys.shape[0])
+        out = np.empty(ys.shape[0], dtype=np.uint8)
+        fast_tables = self.rotors[0].dec_tables
+        for s, e in self._epochs(positions):
+            t = np.arange(n, dtype=np.int8)
+            for i in range(self.num_rotors - 1, 0, -1):
+                t = self.rotors[i].dec_tables[positions[i, s]][t]
+            mid = self._apply_table(t, ys[s:e].astype(np.uint8))
+            out[s:e] = np.take(fast_tables, positions[0, s:e] * n + mid)
+        return out
+
+    # Absolute rotor positions at every character, from the cumulative step counts
+    def _schedule_positions(self, step_counts: np.ndarray, length: int) -> np.ndarray:
+        positions = np.empty((self.num_rotors, length), dtype=np.intp)
         for i in range(0, self.num_rotors):
-            y[i+1] = self.rotors[i].encrypt(y[i])
-        return y
-    
-    def decrypt_with_intermediates(self, y: int) -> List[int]:
-        x = list(range(self.num_rotors + 1))
-        x[0] = y
+            positions[i] = (self.rotors[i].position + step_counts[i]) % self.rotor_size
+        return positions
+
+    # (start, end) ranges of characters over which no rotor other than rotor 0 moves
+    def _epochs(self, positions: np.ndarray):
+        if positions.shape[1] == 0: return []
+        slow = positions[1:]
+        breaks = np.nonzero(np.any(slow[:, 1:] != slow[:, :-1], axis=0))[0] + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [positions.shape[1]]))
+        return zip(starts, ends)
+
+    # Parallel variant of encrypt_bulk_blocked for long messages
+    # Epochs are self-contained (one slow-rotor LUT plus a span of the fast-rotor schedule), so
+    # contiguous groups of them are encrypted on a thread pool; the C inner loop releases the
+    # GIL, letting the groups genuinely overlap.  Deterministic because the whole stepping
+    # schedule is precomputed up front.
+    def encrypt_bulk_parallel(self, xs: np.ndarray, step_counts: np.ndarray, max_workers: int = None) -> np.ndarray:
+        xs = np.asarray(xs, dtype=np.intp)
+        n = self.rotor_size
+        positions = self._schedule_positions(step_counts, xs.shape[0])
+        out = np.empty(xs.shape[0], dtype=np.uint8)
+        epochs = np.array(list(self._epochs(positions)), dtype=np.intp).reshape(-1, 2)
+        fast_tables = self.rotors[0].enc_tables
+        def run_group(group):
+            for s, e in group:
+                t = np.arange(n, dtype=np.int8)
+                for i in range(1, self.num_rotors):
+                    t = self.rotors[i].enc_tables[positions[i, s]][t]
+                mid = np.take(fast_tables, positions[0, s:e] * n + xs[s:e]).astype(np.uint8)
+                out[s:e] = self._apply_table(t, mid)
+        if max_workers is None: max_workers = os.cpu_count()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(run_group, np.array_split(epochs, max_workers)))
+        return out
+
+    # Passes a whole buffer through one substitution table, using the C extension's
+    # SIMD-gather loop when it is available
+    def _apply_table(self, table: np.ndarray, xs: np.ndarray) -> np.ndarray:
+        if _rotor_c is None:
+            return table[np.asarray(xs, dtype=np.intp)]
+        xs = np.ascontiguousarray(xs, dtype=np.uint8)
+        out = np.empty_like(xs)
+        _rotor_c.apply_table(np.ascontiguousarray(table), xs, out)
+        return out
+
+    # Encrypts a message through the C extension's inner loop
+    # positions is an (L, num_rotors) uint8 array giving each rotor's absolute position at every
+    # character (one row per character, so the whole stepping schedule is pre-generated); falls
+    # back to NumPy gathers when the extension is not built
+    def encrypt_bulk_c(self, xs: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        return self._crypt_bulk_c(xs, positions, self.enc_table_stack)
+
+    # C-loop counterpart of decrypt_bulk; reverses the rotor order and uses the reverse tables
+    def decrypt_bulk_c(self, ys: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        return self._crypt_bulk_c(ys, np.asarray(positions)[:, ::-1], self.dec_table_stack[::-1])
+
+    def _crypt_bulk_c(self, xs: np.ndarray, positions: np.ndarray, tables: np.ndarray) -> np.ndarray:
+        xs = np.ascontiguousarray(xs, dtype=np.uint8)
+        positions = np.ascontiguousarray(positions, dtype=np.uint8)
+        assert positions.shape == (xs.shape[0], self.num_rotors)
+        if _rotor_c is None:
+            out = xs.astype(np.intp)
+            for i in range(0, self.num_rotors):
+                out = np.take(tables[i], positions[:, i].astype(np.intp) * self.rotor_size + out)
+            return out.astype(np.uint8)
+        tables = np.ascontiguousarray(tables)
+        out = np.empty_like(xs)
+        _rotor_c.encrypt_buffer(tables, positions, xs, out, self.num_rotors, self.rotor_size)
+        return out
+
+    # Pass a value through the bank, recording the value after each rotor
+    # Writes into the caller's out array when one is given, so repeated analysis or
+    # visualization calls reuse one buffer instead of allocating per character
+    def encrypt_with_intermediates(self, x: int, out: np.ndarray = None) -> np.ndarray:
+        if out is None: out = np.empty(self.num_rotors + 1, dtype=np.uint8)
+        out[0] = x
         for i in range(0, self.num_rotors):
-            x[i+1] = self.rotors[self.num_rotors - i].decrypt(x[i])
-        return x
\ No newline at end of file
+            out[i+1] = self.rotors[i].encode(out[i])
+        return out
+
+    def decrypt_with_intermediates(self, y: int, out: np.ndarray = None) -> np.ndarray:
+        if out is None: out = np.empty(self.num_rotors + 1, dtype=np.uint8)
+        out[0] = y
+        for i in range(0, self.num_rotors):
+            out[i+1] = self.rotors[self.num_rotors - 1 - i].decode(out[i])
+        return out
+
+# Encrypt many independent messages on a thread pool
+# banks may be a single RotorBank shared by every message or a sequence with one bank per
+# message; schedules holds the matching (L, num_rotors) absolute position arrays for
+# encrypt_bulk_c.  Scales with cores when the C extension is built, since its inner loop runs
+# with the GIL released; without it the calls still work but do not overlap.
+def encrypt_many(banks, messages, schedules, max_workers: int = None) -> List[np.ndarray]:
+    if isinstance(banks, RotorBank): banks = [banks for m in messages]
+    def run(job):
+        bank, xs, positions = job
+        return bank.encrypt_bulk_c(xs, positions)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, zip(banks, messages, schedules)))
@@ -0,0 +1,150 @@
+/* _rotor_c.c
+ * C inner loop for bulk rotor-bank encryption
+ *
+ * Exposes one function, encrypt_buffer(tables, positions, in, out, num_rotors, size):
+ *   tables    - int8 buffer of shape (num_rotors, size, size); tables[r][p][x] is rotor r's
+ *               substitution of x at position p (rotor.enc_tables stacked per rotor)
+ *   positions - uint8 buffer of shape (len, num_rotors) holding each rotor's absolute position
+ *               at every character, pre-generated from the machine's stepping schedule
+ *   in / out  - uint8 buffers of length len
+ *
+ * Decryption uses the same entry point: the caller passes the reverse tables stacked in reverse
+ * rotor order together with the matching column order in positions.
+ *
+ * The character loop is plain table lookups, so the GIL is released around it and independent
+ * messages can be processed from multiple threads.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+static PyObject *
+encrypt_buffer(PyObject *self, PyObject *args)
+{
+    Py_buffer tables, positions, in, out;
+    Py_ssize_t num_rotors, size, len, k, r;
+    const unsigned char *tab, *sched, *src;
+    unsigned char *dst;
+
+    if (!PyArg_ParseTuple(args, "y*y*y*w*nn",
+            &tables, &positions, &in, &out, &num_rotors, &size))
+        return NULL;
+
+    len = in.len;
+    if (num_rotors <= 0 || size <= 0 || size > 256 ||
+            out.len != len ||
+            positions.len != len * num_rotors ||
+            tables.len != num_rotors * size * size) {
+        PyBuffer_Release(&tables);
+        PyBuffer_Release(&positions);
+        PyBuffer_Release(&in);
+        PyBuffer_Release(&out);
+        PyErr_SetString(PyExc_ValueError, "buffer sizes do not match");
+        return NULL;
+    }
+
+    tab = (const unsigned char *)tables.buf;
+    sched = (const unsigned char *)positions.buf;
+    src = (const unsigned char *)in.buf;
+    dst = (unsigned char *)out.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (k = 0; k < len; k++) {
+        unsigned int x = src[k];
+        const unsigned char *pos = sched + (size_t)k * num_rotors;
+        for (r = 0; r < num_rotors; r++)
+            x = tab[((size_t)r * size + pos[r]) * size + x];
+        dst[k] = (unsigned char)x;
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&tables);
+    PyBuffer_Release(&positions);
+    PyBuffer_Release(&in);
+    PyBuffer_Release(&out);
+    Py_RETURN_NONE;
+}
+
+/* apply_table(table, in, out)
+ * Passes a whole buffer through one substitution table - the case where a run of characters
+ * shares the same rotor state and the slow rotors have been composed into a single LUT.
+ * With AVX2 the table is widened to int32 and eight characters are translated per
+ * VPGATHERDD; other builds use the scalar loop.
+ */
+static PyObject *
+apply_table(PyObject *self, PyObject *args)
+{
+    Py_buffer table, in, out;
+    Py_ssize_t len, k;
+    const unsigned char *tab, *src;
+    unsigned char *dst;
+
+    if (!PyArg_ParseTuple(args, "y*y*w*", &table, &in, &out))
+        return NULL;
+
+    len = in.len;
+    if (out.len != len || table.len <= 0 || table.len > 256) {
+        PyBuffer_Release(&table);
+        PyBuffer_Release(&in);
+        PyBuffer_Release(&out);
+        PyErr_SetString(PyExc_ValueError, "buffer sizes do not match");
+        return NULL;
+    }
+
+    tab = (const unsigned char *)table.buf;
+    src = (const unsigned char *)in.buf;
+    dst = (unsigned char *)out.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+#ifdef __AVX2__
+    {
+        int32_t tab32[256];
+        for (k = 0; k < table.len; k++)
+            tab32[k] = tab[k];
+        for (k = 0; k + 8 <= len; k += 8) {
+            __m128i bytes = _mm_loadl_epi64((const __m128i *)(src + k));
+            __m256i idx = _mm256_cvtepu8_epi32(bytes);
+            __m256i g = _mm256_i32gather_epi32(tab32, idx, 4);
+            __m128i p16 = _mm_packus_epi32(_mm256_castsi256_si128(g),
+                                           _mm256_extracti128_si256(g, 1));
+            _mm_storel_epi64((__m128i *)(dst + k),
+                             _mm_packus_epi16(p16, _mm_setzero_si128()));
+        }
+        for (; k < len; k++)
+            dst[k] = tab[src[k]];
+    }
+#else
+    for (k = 0; k < len; k++)
+        dst[k] = tab[src[k]];
+#endif
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&table);
+    PyBuffer_Release(&in);
+    PyBuffer_Release(&out);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef rotor_c_methods[] = {
+    {"encrypt_buffer", encrypt_buffer, METH_VARARGS,
+     "Encrypt a buffer of characters through stacked per-position rotor tables."},
+    {"apply_table", apply_table, METH_VARARGS,
+     "Pass a buffer of characters through a single composed substitution table."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef rotor_c_module = {
+    PyModuleDef_HEAD_INIT, "_rotor_c",
+    "C inner loop for bulk rotor-bank encryption.", -1, rotor_c_methods
+};
+
+PyMODINIT_FUNC
+PyInit__rotor_c(void)
+{
+    return PyModule_Create(&rotor_c_module);
+}
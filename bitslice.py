@@ -0,0 +1,134 @@
+# Bitsliced rotor evaluation for massively parallel key search
+# Packs many candidate machines into the bit lanes of uint64 words: lane l of every word belongs
+# to candidate l, so one round of word-wide logic advances 64 candidates per word at once.
+# Each symbol in [0, n) is held as `bits` separate words (bits = 5 for the usual 26-symbol rotor),
+# and each lane may carry a different wiring and a different rotor position, which is what a
+# brute-force search over keys needs.
+#
+# Typical use for key search: build one composite or per-rotor substitution table per candidate
+# (e.g. from rotor.enc_tables or RotorBank.composite_table), pack them with compile_tables once,
+# then drive encode_rotor character by character on bitsliced values.
+#
+# All functions operate on arrays of shape (bits, W) where W = ceil(num_lanes / 64); lanes beyond
+# num_lanes are don't-care bits.
+
+import numpy as np
+
+_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+# Pack a vector of lane values into bitsliced form
+# values is a length-M integer array with entries in [0, 2**bits); returns a (bits, W) uint64 array
+def bitslice(values, bits: int) -> np.ndarray:
+    values = np.asarray(values)
+    num_lanes = values.shape[0]
+    num_words = (num_lanes + 63) // 64
+    words = np.zeros((bits, num_words), dtype=np.uint64)
+    lanes = np.arange(num_lanes)
+    word_index = lanes // 64
+    bit_index = (lanes % 64).astype(np.uint64)
+    for b in range(bits):
+        lane_bits = ((values >> b) & 1).astype(np.uint64) << bit_index
+        np.bitwise_or.at(words[b], word_index, lane_bits)
+    return words
+
+
+# Unpack bitsliced form back into a vector of num_lanes lane values
+def unbitslice(words: np.ndarray, num_lanes: int) -> np.ndarray:
+    bits = words.shape[0]
+    lanes = np.arange(num_lanes)
+    word_index = lanes // 64
+    bit_index = (lanes % 64).astype(np.uint64)
+    out = np.zeros(num_lanes, dtype=np.int64)
+    for b in range(bits):
+        out |= (((words[b, word_index] >> bit_index) & np.uint64(1)).astype(np.int64)) << b
+    return out
+
+
+# Pack one substitution table per lane into the mask form consumed by apply_tables
+# tables is an (M, size) array where row l is lane l's table; returns a (size, bits, W) array
+# where mask bit l of tables_masks[x, b] is bit b of tables[l, x]
+def compile_tables(tables: np.ndarray, bits: int) -> np.ndarray:
+    tables = np.asarray(tables)
+    size = tables.shape[1]
+    return np.stack([bitslice(tables[:, x], bits) for x in range(size)])
+
+
+# Apply per-lane substitution tables to a bitsliced value
+# For each possible input x, a match mask selects the lanes currently holding x, and the lanes'
+# own table bits for x are OR-merged into the output — size * (2 * bits + 1) word ops total
+def apply_tables(words: np.ndarray, table_masks: np.ndarray) -> np.ndarray:
+    bits = words.shape[0]
+    size = table_masks.shape[0]
+    out = np.zeros_like(words)
+    for x in range(size):
+        match = np.full_like(words[0], _ONES)
+        for b in range(bits):
+            match &= words[b] if (x >> b) & 1 else words[b] ^ _ONES
+        for b in range(bits):
+            out[b] |= match & table_masks[x, b]
+    return out
+
+
+# Bitsliced masks for a constant value, broadcast across all lanes
+def _const(value: int, bits: int, num_words: int) -> np.ndarray:
+    out = np.empty((bits, num_words), dtype=np.uint64)
+    for b in range(bits):
+        out[b] = _ONES if (value >> b) & 1 else 0
+    return out
+
+
+# Ripple-carry add of two bitsliced values; returns (sum, carry-out)
+def _add(a: np.ndarray, b: np.ndarray):
+    out = np.empty_like(a)
+    carry = np.zeros_like(a[0])
+    for i in range(a.shape[0]):
+        axb = a[i] ^ b[i]
+        out[i] = axb ^ carry
+        carry = (a[i] & b[i]) | (carry & axb)
+    return out, carry
+
+# Ripple-borrow subtract of two bitsliced values; returns (difference, borrow-out)
+def _sub(a: np.ndarray, b: np.ndarray):
+    out = np.empty_like(a)
+    borrow = np.zeros_like(a[0])
+    for i in range(a.shape[0]):
+        axb = a[i] ^ b[i]
+        out[i] = axb ^ borrow
+        borrow = ((a[i] ^ _ONES) & b[i]) | ((axb ^ _ONES) & borrow)
+    return out, borrow
+
+
+# (a + b) mod n for bitsliced a, b with per-lane values in [0, n)
+def mod_add(a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
+    s, carry = _add(a, b)
+    t, borrow = _sub(s, _const(n, a.shape[0], a.shape[1]))
+    # Subtract n wherever the raw sum reached n: either it overflowed the bit width outright,
+    # or the trial subtraction needed no borrow
+    reduce_mask = carry | (borrow ^ _ONES)
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = (t[i] & reduce_mask) | (s[i] & (reduce_mask ^ _ONES))
+    return out
+
+# (a - b) mod n for bitsliced a, b with per-lane values in [0, n)
+def mod_sub(a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
+    d, borrow = _sub(a, b)
+    correction = _const(n, a.shape[0], a.shape[1])
+    for i in range(a.shape[0]):
+        correction[i] &= borrow
+    out, carry = _add(d, correction)
+    return out
+
+# (a + 1) mod n — bitsliced odometer step of a position vector
+def increment_mod(a: np.ndarray, n: int) -> np.ndarray:
+    return mod_add(a, _const(1, a.shape[0], a.shape[1]), n)
+
+
+# One full rotor encode with a different wiring and position per lane
+# x_bits/pos_bits are bitsliced input values and rotor positions, wiring_masks comes from
+# compile_tables over the per-lane wirings; computes (wiring[(x - pos) mod n] + pos) mod n
+def encode_rotor(x_bits: np.ndarray, pos_bits: np.ndarray, wiring_masks: np.ndarray, n: int) -> np.ndarray:
+    t = mod_sub(x_bits, pos_bits, n)
+    y = apply_tables(t, wiring_masks)
+    return mod_add(y, pos_bits, n)
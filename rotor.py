@@ -14,15 +14,21 @@
 
 from typing import List
 
+import numpy as np
+
 class rotor:
 
+    # Fixed attribute set: __slots__ drops the per-instance __dict__, shrinking each rotor and
+    # making attribute reads in the inner loops a touch faster
+    __slots__ = ('size', 'position', 'wiring', 'reverse_wiring', 'reversed', 'enc_tables', 'dec_tables')
+
     # Create a new rotor with specified wiring configuration
     def __init__(self, wiring: List[int]):
         self.set_wiring(wiring)
 
     def get_size(self) -> int: return self.size
-    def get_wiring(self) -> List[int]: return self.wiring
-    def get_reverse_wiring(self) -> List[int]: return self.reverse_wiring
+    def get_wiring(self) -> np.ndarray: return self.wiring
+    def get_reverse_wiring(self) -> np.ndarray: return self.reverse_wiring
     def get_position(self) -> int: return self.position
     
     # Reversed orientation - used only in historical modes, redundant if using full keyspace
@@ -43,24 +49,41 @@ class rotor:
     # Takes a sequence containing some permutation of 0,1,...,n-1
     # Resets position to 0, since this is a safe value regardless of rotor size, and resets reversed flag
     # Automatically sets size to n and calculates the reverse wiring
+    # Wiring is stored as a NumPy int8 array so that bulk encryption can gather through it directly
     def set_wiring(self, wiring: List[int]):
         self.position = 0
         self.reversed = False
         self.size = len(wiring)
         assert self.size > 0, "Wiring sequence is empty"
-        self.wiring = wiring
-        self.reverse_wiring = [i for i in range(self.size)]
-        for i in range(self.size):
-            j = self.wiring[i]
-            assert 0 <= j < self.size, "Wiring value outside valid range"
-            assert j not in wiring[0,i], "Duplicate wiring value"
-            self.reverse_wiring[j] = i
+        self.wiring = np.asarray(wiring, dtype=np.int8)
+        # Vectorized validation and inversion: the membership test of the old per-element loop
+        # made this O(n^2), which adds up when bulk-loading rotors for a key search
+        assert int(self.wiring.min()) >= 0 and int(self.wiring.max()) < self.size, "Wiring value outside valid range"
+        assert np.unique(self.wiring).size == self.size, "Duplicate wiring value"
+        self.reverse_wiring = np.argsort(self.wiring).astype(np.int8)
+        # Precompute the substitution at every possible position, so that encode/decode reduce
+        # to a single table lookup instead of offset arithmetic per character
+        # enc_tables[p, x] is the encoding of x at position p; dec_tables[p, y] the matching decoding
+        p = np.arange(self.size)[:, None]
+        x = np.arange(self.size)[None, :]
+        self.enc_tables = ((self.wiring[(x - p) % self.size] + p) % self.size).astype(np.int8)
+        self.dec_tables = ((self.reverse_wiring[(x - p) % self.size] + p) % self.size).astype(np.int8)
 
     # Steps the rotor, using the SIGABA sign convention; number of steps may be large or negative
     # Large values roll over modulo n; negative values step the rotor in the other direction (use -1 for Enigma)
     # This is the recommended method to step a rotor during encoding, decoding, or US Navy historical SIGABA setup
     # Otherwise, set_position is typically used for setting inital rotor positions
-    def step(self, steps: int = 1): self.position = (self.position + steps) % self.size
+    # Single steps in either direction are by far the common case during encryption, so they
+    # replace the modulo with a compare-and-reset
+    def step(self, steps: int = 1):
+        if steps == 1:
+            p = self.position + 1
+            self.position = 0 if p == self.size else p
+        elif steps == -1:
+            p = self.position
+            self.position = self.size - 1 if p == 0 else p - 1
+        else:
+            self.position = (self.position + steps) % self.size
 
     # Passes a value through the rotor
     def encode(self, x: int) -> int:
@@ -68,8 +91,7 @@ class rotor:
 #        if reversed:
 #            y = self.reverse_wiring[self.size - 1 - ((x + self.position) % self.size)]
 #            return ((self.size - 1 - y) - self.position) % self.size
-        y = self.wiring[(x - self.position) % self.size]
-        return (y + self.position) % self.size
+        return int(self.enc_tables[self.position, x])
 
     # Passes a value through the rotor from behind; used for decryption in most machines
     def decode(self, y: int) -> int:
@@ -77,5 +99,4 @@ class rotor:
 #        if reversed:
 #            x = self.wiring(self.size - 1 - ((y + self.position) % self.size))
 #            return ((self.size - 1 - x) - self.position) % self.size
-        x = self.reverse_wiring[(y - self.position) % self.size]
-        return (x + self.position) % self.size
+        return int(self.dec_tables[self.position, y])
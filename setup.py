@@ -0,0 +1,18 @@
+# Builds the optional _rotor_c extension; the Python code falls back to NumPy without it
+# Build in place with: python setup.py build_ext --inplace
+
+import platform
+
+from setuptools import setup, Extension
+
+extra_compile_args = ["-O3"]
+# Enable the AVX2 gather path on x86-64; drop this flag when building for CPUs without AVX2
+# (the extension falls back to the scalar loop when the flag is absent)
+if platform.machine() in ("x86_64", "AMD64"):
+    extra_compile_args.append("-mavx2")
+
+setup(
+    name="rotor-machine",
+    py_modules=["rotor", "Rotor_Machine", "bitslice"],
+    ext_modules=[Extension("_rotor_c", sources=["_rotor_c.c"], extra_compile_args=extra_compile_args)],
+)